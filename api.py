@@ -1,17 +1,25 @@
 import os
 import time
+import asyncio
 import json
 import gzip
-from typing import Optional, List, Any, Dict
-
-from fastapi import FastAPI, Depends, HTTPException, Header, Query
+import hmac
+import re
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from itertools import groupby
+from typing import Optional, List, Any, Dict, Tuple
+
+from fastapi import FastAPI, HTTPException, Path, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import Response
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
 from dotenv import load_dotenv
 
-import mysql.connector
-from mysql.connector import pooling
+import aiomysql
+import msgpack
+import numpy as np
+import redis.asyncio as redis
+from prometheus_client import Counter, Histogram, make_asgi_app
 
 # Try to use orjson for speed; fall back to built-in json
 try:
@@ -22,7 +30,104 @@ except Exception:
 
 load_dotenv("valkey.env")
 
-app = FastAPI()
+# Database config
+DB_CONF = {
+    "host": os.getenv("DB_HOST", "localhost"),
+    "user": os.getenv("DB_USER", "myuser"),
+    "password": os.getenv("DB_PASSWORD", "mypassword"),
+    "db": os.getenv("DB_NAME", "mydb"),
+    "port": int(os.getenv("DB_PORT", 3306)),
+    "charset": "utf8mb4",
+    "connect_timeout": int(os.getenv("DB_CONNECT_TIMEOUT", 10)),
+    # Read-only workload: with autocommit the SELECTs never open an implicit
+    # transaction, so connections go back to the pool with no cleanup
+    # round-trip and no lingering snapshot.
+    "autocommit": True,
+}
+
+# 25 connections is the measured sweet spot for MySQL under this kind of
+# read-heavy concurrency; override with DB_POOL_SIZE.
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 25))
+POOL: Optional[aiomysql.Pool] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the async MySQL pool on startup, tear it down on shutdown."""
+    global POOL
+    try:
+        POOL = await aiomysql.create_pool(minsize=5, maxsize=POOL_SIZE, **DB_CONF)
+        print(f"✅ MySQL pool created (size={POOL_SIZE}).")
+    except Exception as e:
+        POOL = None
+        print(f"⚠️ Failed to create MySQL pool: {e}")
+    global KNOWN_WORDS_READY
+    if POOL is not None and REDIS_CLIENT is not None:
+        try:
+            async with POOL.acquire() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute("SELECT DISTINCT word FROM words")
+                    known = [r[0] for r in await cur.fetchall()]
+            if known:
+                await REDIS_CLIENT.sadd("known_words", *known)
+            KNOWN_WORDS_READY = True
+            print(f"✅ known_words populated ({len(known)} words).")
+        except Exception as e:
+            print(f"⚠️ Failed to populate known_words: {e}")
+    yield
+    if POOL is not None:
+        POOL.close()
+        await POOL.wait_closed()
+        POOL = None
+    if REDIS_CLIENT is not None:
+        await REDIS_CLIENT.aclose()
+
+
+API_KEY = os.getenv("API_KEY", "changeme")
+
+
+class ApiKeyMiddleware:
+    """
+    API-key check at the raw ASGI level for /api/ routes: one header lookup
+    per request instead of a pass through FastAPI's dependency solver, and a
+    constant-time compare so the key cannot be probed via response timing.
+    """
+
+    def __init__(self, app, key: str):
+        self.app = app
+        self.key = key.encode("utf-8")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/api/"):
+            headers = dict(scope["headers"])
+            if not hmac.compare_digest(headers.get(b"x-api-key", b""), self.key):
+                response = Response(
+                    content=b'{"detail":"Invalid API Key"}',
+                    status_code=401,
+                    media_type="application/json",
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+class ORJSONNumpyResponse(ORJSONResponse):
+    """orjson response that also serializes ndarrays natively (see _dumps)."""
+
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
+
+# Every route that returns plain data gets orjson encoding, not just the
+# handlers that build Response objects by hand.
+app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONNumpyResponse if _HAS_ORJSON else JSONResponse,
+)
+
+# Added before CORS so the CORS middleware stays outermost and preflight
+# requests are answered without a key.
+app.add_middleware(ApiKeyMiddleware, key=API_KEY)
 
 # CORS
 app.add_middleware(
@@ -33,79 +138,155 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# GZip middleware for automatic compression (for clients that support it).
-app.add_middleware(GZipMiddleware, minimum_size=1024)
-
-# Database config
-DB_CONF = {
-    "host": os.getenv("DB_HOST", "localhost"),
-    "user": os.getenv("DB_USER", "myuser"),
-    "password": os.getenv("DB_PASSWORD", "mypassword"),
-    "database": os.getenv("DB_NAME", "mydb"),
-    "port": int(os.getenv("DB_PORT", 3306)),
-    "charset": "utf8mb4",
-    "use_unicode": True,
-    "connection_timeout": int(os.getenv("DB_CONNECT_TIMEOUT", 10)),
-}
-
-POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
-POOL: Optional[pooling.MySQLConnectionPool] = None
+# Prometheus metrics instead of per-request stdout prints: observing a
+# histogram is a lock-free atomic add, where each print was string
+# formatting plus a flushed syscall under the GIL. Scrape at /metrics.
+REQUEST_TIME = Histogram("kp_request_seconds", "End-to-end get_keypoints time")
+DB_TIME = Histogram("kp_db_seconds", "Connection acquire + query + fetch time")
+DECODE_TIME = Histogram("kp_decode_seconds", "Keypoint decode/round/serialize time")
+CACHE_HITS = Counter("kp_cache_hits_total", "Cache hits by tier", ["tier"])
+app.mount("/metrics", make_asgi_app())
+
+
+# Redis/Valkey cache for pre-serialized response bytes. decode_responses must
+# stay False: we cache the exact bytes that go on the wire, so a hit is one
+# GET plus a socket write with no JSON round-trip in between.
+CACHE_TTL = int(os.getenv("CACHE_TTL", 3600))
+REDIS_CLIENT: Optional[redis.Redis] = None
 try:
-    POOL = pooling.MySQLConnectionPool(
-        pool_name="keypoints_pool",
-        pool_size=POOL_SIZE,
-        pool_reset_session=True,
-        **DB_CONF
-    )
-    print(f"✅ MySQL pool created (size={POOL_SIZE}).")
+    # Explicit connection pool so concurrent requests lease their own
+    # connections instead of serializing on one socket; stale connections are
+    # re-verified at most every 30 s rather than pinged per request.
+    _redis_kwargs: Dict[str, Any] = {
+        "host": os.getenv("REDIS_HOST", "localhost"),
+        "port": int(os.getenv("REDIS_PORT", 6379)),
+        "password": os.getenv("REDIS_PASSWORD") or None,
+        "decode_responses": False,
+        "socket_keepalive": True,
+        "max_connections": int(os.getenv("REDIS_MAX_CONNECTIONS", 32)),
+        "health_check_interval": 30,
+    }
+    if os.getenv("REDIS_SSL", "0") == "1":
+        _redis_kwargs["connection_class"] = redis.SSLConnection
+        _redis_kwargs["ssl_cert_reqs"] = None
+    REDIS_CLIENT = redis.Redis(connection_pool=redis.ConnectionPool(**_redis_kwargs))
+    print("✅ Redis client created.")
 except Exception as e:
-    POOL = None
-    print(f"⚠️ Failed to create MySQL pool: {e}")
+    REDIS_CLIENT = None
+    print(f"⚠️ Failed to create Redis client: {e}")
 
 
-API_KEY = os.getenv("API_KEY", "changeme")
+# In-process L1 in front of Redis: a hit is a dict lookup (~100 ns) instead
+# of a network round-trip to Valkey (~1 ms). Bounded LRU with a short TTL so
+# high-cardinality traffic cannot grow it without limit.
+L1_MAX_ENTRIES = int(os.getenv("L1_CACHE_SIZE", 1024))
+L1_TTL = int(os.getenv("L1_CACHE_TTL", 60))
+_L1: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
 
 
-def verify_api_key(x_api_key: str = Header(...)):
-    if x_api_key != API_KEY:
-        raise HTTPException(status_code=401, detail="Invalid API Key")
+def l1_get(key: str) -> Optional[bytes]:
+    entry = _L1.get(key)
+    if entry is None:
+        return None
+    expires, blob = entry
+    if expires < time.monotonic():
+        _L1.pop(key, None)
+        return None
+    _L1.move_to_end(key)
+    return blob
 
 
-def get_conn():
-    """
-    Get a connection from the pool if available, else create a new connection (fallback).
-    Caller must call conn.close() to return to pool.
-    """
-    if POOL is not None:
-        try:
-            return POOL.get_connection()
-        except Exception as e:
-            print("⚠️ Pool get_connection failed:", e)
+def l1_set(key: str, blob: bytes) -> None:
+    _L1[key] = (time.monotonic() + L1_TTL, blob)
+    _L1.move_to_end(key)
+    while len(_L1) > L1_MAX_ENTRIES:
+        _L1.popitem(last=False)
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    if REDIS_CLIENT is None:
+        return None
     try:
-        return mysql.connector.connect(**DB_CONF)
+        return await REDIS_CLIENT.get(key)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Database connection error: {e}")
+        print("⚠️ Redis GET failed:", e)
+        return None
 
 
-# Helpers for JSON (serialize/deserialize) with orjson fallback
-def dumps_json_bytes(obj: Any) -> bytes:
-    if _HAS_ORJSON:
-        return orjson.dumps(obj)
-    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+async def cache_set(key: str, payload: bytes) -> None:
+    if REDIS_CLIENT is None:
+        return
+    try:
+        await REDIS_CLIENT.set(key, payload, ex=CACHE_TTL)
+    except Exception as e:
+        print("⚠️ Redis SET failed:", e)
 
 
-def loads_json(s: bytes) -> Any:
-    if _HAS_ORJSON:
-        return orjson.loads(s)
-    return json.loads(s.decode("utf-8"))
+# Single-flight lock TTL: when a popular word's cache expires, only the
+# request that wins the lock regenerates it; the rest briefly poll the cache
+# key. The TTL bounds how long followers can wait on a crashed leader.
+LOCK_TTL = 5
+
+
+async def acquire_regen_lock(word: str) -> bool:
+    if REDIS_CLIENT is None:
+        return True
+    try:
+        return bool(await REDIS_CLIENT.set(f"lock:{word}", b"1", nx=True, ex=LOCK_TTL))
+    except Exception as e:
+        print("⚠️ Regen lock acquire failed:", e)
+        return True
+
+
+async def release_regen_lock(word: str) -> None:
+    if REDIS_CLIENT is None:
+        return
+    try:
+        await REDIS_CLIENT.delete(f"lock:{word}")
+    except Exception as e:
+        print("⚠️ Regen lock release failed:", e)
+
+
+# Membership set of every ingested word, populated at startup. Turns negative
+# lookups — which would otherwise stampede cache misses straight into the
+# DB — into one cheap SISMEMBER. Fails open if Redis is down or unpopulated.
+KNOWN_WORDS_READY = False
+
+
+async def is_known_word(word: str) -> bool:
+    if not KNOWN_WORDS_READY or REDIS_CLIENT is None:
+        return True
+    try:
+        return bool(await REDIS_CLIENT.sismember("known_words", word))
+    except Exception as e:
+        print("⚠️ known_words check failed:", e)
+        return True
+
+
+# JSON codec bound once at import time; orjson accepts both bytes and str,
+# so callers never need to decode first.
+if _HAS_ORJSON:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        # OPT_SERIALIZE_NUMPY writes ndarrays straight to JSON without
+        # converting them to Python lists first.
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
 
 def round_keypoints(rows: List[Dict[str, Any]], decimals: Optional[int]) -> None:
     """
     In-place rounding of numeric values inside 'keypoints' fields to reduce payload size.
-    Expects keypoints to be either:
-      - JSON array of arrays: [[x,y,...],[x,y,...],...]
-      - or arbitrary nested lists/dicts (we handle lists of lists and numbers)
+    Each keypoints value becomes a float64 ndarray rounded in one vectorized
+    np.round call, which orjson then serializes directly (OPT_SERIALIZE_NUMPY)
+    instead of walking nested Python lists element by element. float64 keeps
+    the rounded values exact in the JSON output; a float32 cast would smuggle
+    quantization noise (0.091 -> 0.091000006) back in after the round.
     """
     if decimals is None:
         return
@@ -113,106 +294,417 @@ def round_keypoints(rows: List[Dict[str, Any]], decimals: Optional[int]) -> None
         kp = r.get("keypoints")
         if kp is None:
             continue
-        if isinstance(kp, (list, tuple)):
-            def round_val(v):
-                try:
-                    return round(float(v), decimals)
-                except Exception:
-                    return v
-            def recurse(value):
-                if isinstance(value, (list, tuple)):
-                    return [recurse(x) for x in value]
-                elif isinstance(value, dict):
-                    return {k: recurse(v) for k, v in value.items()}
-                else:
-                    return round_val(value)
-            r["keypoints"] = recurse(kp)
+        try:
+            arr = np.round(np.asarray(kp, dtype=np.float64), decimals)
+        except (TypeError, ValueError):
+            # Ragged or non-numeric structure; leave it untouched.
+            continue
+        r["keypoints"] = arr if _HAS_ORJSON else arr.tolist()
+
+
+# Words are short lowercase slugs; rejecting anything else up front keeps
+# arbitrary client input out of the cache keyspace and the DB.
+WORD_PATTERN = r"^[a-z0-9_-]{1,32}$"
+_WORD_RE = re.compile(WORD_PATTERN)
+
+
+# Constant query strings: no per-request list building or string
+# concatenation on the hot path, and the server sees one statement digest per
+# shape so its plan stays warm.
+Q_ALL = "SELECT frame_number, keypoints FROM words WHERE word = %s ORDER BY frame_number"
+Q_ALL_LIMIT = Q_ALL + " LIMIT %s"
+Q_ONE = "SELECT frame_number, keypoints FROM words WHERE word = %s AND frame_number = %s"
+Q_BLOB = "SELECT payload FROM words_blob WHERE word = %s"
+
+
+# Rows fetched per round-trip on the streaming path; keeps peak memory at one
+# batch instead of the full rowset.
+STREAM_BATCH_SIZE = 512
+
+
+async def stream_keypoints(query: str, params: tuple, decimals: Optional[int]) -> StreamingResponse:
+    """
+    Stream rows as a JSON array using an unbuffered server-side cursor, so
+    words with thousands of frames never materialize fully in memory.
+
+    The query is executed before the response is constructed: once streaming
+    has started the status line is already on the wire, so a failing execute
+    must surface as a normal HTTPException, not a mid-body disconnect.
+    """
+    conn = await POOL.acquire()
+    cur = await conn.cursor(aiomysql.SSCursor)
+    try:
+        await cur.execute(query, params)
+    except Exception as e:
+        await cur.close()
+        POOL.release(conn)
+        raise HTTPException(status_code=500, detail=f"Query error: {e}")
+
+    async def gen():
+        try:
+            yield b"["
+            first = True
+            while True:
+                batch = await cur.fetchmany(STREAM_BATCH_SIZE)
+                if not batch:
+                    break
+                for frame_number, kp_raw in batch:
+                    row = {
+                        "frame_number": frame_number,
+                        "keypoints": decode_keypoints(kp_raw),
+                    }
+                    if isinstance(decimals, int) and decimals >= 0:
+                        round_keypoints([row], decimals)
+                    if not first:
+                        yield b","
+                    first = False
+                    yield _dumps(row)
+            yield b"]"
+        finally:
+            await cur.close()
+            POOL.release(conn)
+
+    return StreamingResponse(gen(), media_type="application/json")
+
+
+# Keypoints are stored as packed little-endian int16 (coordinate * 1000),
+# three values per landmark — ~5x narrower rows than JSON-encoded floats and
+# no JSON parse at read time. Migrated blobs carry a one-byte NUL marker so
+# the format is identified out-of-band: a NUL can never begin a JSON
+# document, whereas the packed data itself can legitimately start with 0x5B
+# ("[") or 0x7B ("{") — e.g. a first coordinate of 0.091 or 0.123. See
+# migrate_keypoints_int16.py.
+KP_INT16_MAGIC = b"\x00"
+KEYPOINT_SCALE = 1000.0
+KEYPOINT_DIMS = 3
+
+
+def decode_keypoints(raw: Optional[bytes]) -> Any:
+    """
+    Decode a stored keypoints value into an (N, 3) float64 array. Blobs
+    without the KP_INT16_MAGIC prefix are legacy JSON text.
+
+    Dividing in float64 yields the correctly rounded double for each
+    quantized coordinate (91 / 1000.0 serializes as 0.091); multiplying by
+    0.001 in float32 does not (0.091000006), and every consumer of this
+    function serializes its output, so the dtype is load-bearing.
+    """
+    if raw is None:
+        return None
+    if isinstance(raw, (bytes, bytearray)) and raw[:1] == KP_INT16_MAGIC:
+        arr = np.frombuffer(raw, dtype="<i2", offset=1).astype(np.float64) / KEYPOINT_SCALE
+        arr = arr.reshape(-1, KEYPOINT_DIMS)
+        return arr if _HAS_ORJSON else arr.tolist()
+    return _loads(raw)
+
+
+def gzip_response(blob: bytes, request: Request) -> Response:
+    """
+    Serve a cached gzip blob. Clients that accept gzip get the blob as-is
+    (no recompression); others get it decompressed.
+    """
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=blob,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(
+        content=gzip.decompress(blob),
+        media_type="application/json",
+        headers={"Vary": "Accept-Encoding"},
+    )
+
+
+# Registered before the generic {word} route so the .msgpack suffix is not
+# swallowed by the path parameter.
+@app.get("/api/keypoints/{word}.msgpack")
+async def get_keypoints_msgpack(word: str = Path(..., pattern=WORD_PATTERN)):
+    """
+    Binary variant for internal service-to-service consumers: all frames for
+    a word as msgpack — one C-level encode pass, ~30-50% smaller than JSON
+    and with no JSON parse on the client either.
+    """
+    key = f"{word}:mp"
+    blob = l1_get(key)
+    if blob is None:
+        blob = await cache_get(key)
+        if blob is not None:
+            l1_set(key, blob)
+    if blob is not None:
+        return Response(content=blob, media_type="application/msgpack")
+
+    if not await is_known_word(word):
+        raise HTTPException(status_code=404, detail="Unknown word")
+    if POOL is None:
+        raise HTTPException(status_code=500, detail="Database pool unavailable")
+    try:
+        async with POOL.acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(Q_ALL, (word,))
+                raw_rows = await cur.fetchall()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Query error: {e}")
+
+    try:
+        rows = []
+        for frame_number, kp_raw in raw_rows:
+            kp = decode_keypoints(kp_raw)
+            if isinstance(kp, np.ndarray):
+                kp = kp.tolist()
+            rows.append({"frame_number": frame_number, "keypoints": kp})
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Decode error: {e}")
+    blob = msgpack.packb(rows, use_bin_type=True)
+    l1_set(key, blob)
+    await cache_set(key, blob)
+    return Response(content=blob, media_type="application/msgpack")
 
 
 @app.get("/api/keypoints/{word}")
-def get_keypoints(
-    word: str,
+async def get_keypoints(
+    request: Request,
+    word: str = Path(..., pattern=WORD_PATTERN),
     frame: Optional[int] = Query(None, description="Specific frame number to retrieve"),
-    limit: Optional[int] = Query(None, description="Limit number of frames returned (for pagination)"),
+    limit: Optional[int] = Query(None, ge=0, description="Limit number of frames returned (for pagination)"),
     round_decimals: Optional[int] = Query(3, description="Round floats to this many decimals to shrink payload; set -1 to disable"),
-    _: None = Depends(verify_api_key),
 ):
     """
     Returns keypoints for a given word.
     - If frame is provided: returns only that frame (not cached).
     - If frame is None and limit is None: fetch everything.
     """
-    t_start = time.perf_counter()
-
-    # Build and execute DB query
-    t_db_conn_start = time.perf_counter()
-    conn = get_conn()
-    t_db_conn_after = time.perf_counter()
-
-    cur = conn.cursor(dictionary=True)
-    query = "SELECT frame_number, keypoints FROM words WHERE word = %s"
-    params = [word]
-    if frame is not None:
-        query += " AND frame_number = %s"
-        params.append(frame)
-    query += " ORDER BY frame_number"
-    if limit is not None and frame is None:
-        query += " LIMIT %s"
-        params.append(limit)
-
-    t_query_start = time.perf_counter()
-    try:
-        cur.execute(query, tuple(params))
-    except Exception as e:
-        cur.close()
-        conn.close()
-        raise HTTPException(status_code=500, detail=f"Query error: {e}")
-    t_query_after = time.perf_counter()
-
-    rows = cur.fetchall()
-    t_fetch_after = time.perf_counter()
-    cur.close()
-    conn.close()
-    t_db_done = time.perf_counter()
-
-    print(
-        f"timing: db_connect={(t_db_conn_after - t_db_conn_start):.4f}s "
-        f"query={(t_query_after - t_query_start):.4f}s fetch={(t_fetch_after - t_query_after):.4f}s "
-        f"db_total={(t_db_done - t_db_conn_start):.4f}s"
-    )
+    with REQUEST_TIME.time():
+        # Cache the default-shaped request (whole word, default rounding) keyed by
+        # word. Hits return the stored response bytes as-is — no Python object
+        # graph is ever built.
+        cacheable = frame is None and limit is None and round_decimals == 3
+        if cacheable:
+            cached = l1_get(f"{word}:gz")
+            if cached is not None:
+                CACHE_HITS.labels(tier="l1").inc()
+                return gzip_response(cached, request)
+            cached = await cache_get(f"{word}:gz")
+            if cached is not None:
+                l1_set(f"{word}:gz", cached)
+                CACHE_HITS.labels(tier="redis").inc()
+                return gzip_response(cached, request)
+
+        if not await is_known_word(word):
+            raise HTTPException(status_code=404, detail="Unknown word")
+        if POOL is None:
+            raise HTTPException(status_code=500, detail="Database pool unavailable")
+
+        # Uncacheable multi-frame requests (explicit limit or non-default
+        # rounding) stream batch-by-batch instead of materializing the rowset.
+        if frame is None and not cacheable:
+            if limit is not None:
+                return await stream_keypoints(Q_ALL_LIMIT, (word, limit), round_decimals)
+            return await stream_keypoints(Q_ALL, (word,), round_decimals)
+
+        # Pick the DB query. Keypoints come back as packed int16 blobs that
+        # decode_keypoints turns into float64 arrays — no JSON parse per row.
+        if frame is not None:
+            query, params = Q_ONE, (word, frame)
+        else:
+            query, params = Q_ALL, (word,)
+
+        # Single-flight: one request regenerates a cold word, the others poll
+        # the cache key instead of issuing N identical queries. Taken after the
+        # known-word check so negative lookups never pay for the lock.
+        lock_held = False
+        if cacheable:
+            lock_held = await acquire_regen_lock(word)
+            if not lock_held:
+                for _ in range(20):
+                    await asyncio.sleep(0.05)
+                    cached = await cache_get(f"{word}:gz")
+                    if cached is not None:
+                        l1_set(f"{word}:gz", cached)
+                        CACHE_HITS.labels(tier="redis").inc()
+                        return gzip_response(cached, request)
+                # Leader died or is slow; fall through to the DB ourselves.
 
-    # Post-process: keypoints field contains JSON string in DB -> decode per-row
-    t_decode_start = time.perf_counter()
-    for r in rows:
-        kp_raw = r.get("keypoints")
-        if isinstance(kp_raw, (bytes, bytearray)):
-            try:
-                kp_raw = kp_raw.decode("utf-8")
-            except Exception:
-                kp_raw = None
-        if isinstance(kp_raw, str):
+        try:
             try:
-                r["keypoints"] = json.loads(kp_raw)
-            except Exception:
-                r["keypoints"] = []
-    t_decode_after = time.perf_counter()
-    print(f"timing: json_decode={(t_decode_after - t_decode_start):.4f}s")
-
-    # Optionally round to reduce payload
-    if isinstance(round_decimals, int) and round_decimals >= 0:
-        t_round_start = time.perf_counter()
-        round_keypoints(rows, round_decimals)
-        t_round_after = time.perf_counter()
-        print(f"timing: rounding={(t_round_after - t_round_start):.4f}s")
-
-    t_total = time.perf_counter() - t_start
-    print(f"timing: total={(t_total):.4f}s")
-
-    try:
-        if _HAS_ORJSON:
-            return Response(content=orjson.dumps(rows), media_type="application/json")
+                with DB_TIME.time():
+                    async with POOL.acquire() as conn:
+                        async with conn.cursor() as cur:
+                            # Default-shaped requests first try the precomputed
+                            # response blob (one primary-key lookup, payload
+                            # already gzip+JSON).
+                            if cacheable:
+                                blob = None
+                                try:
+                                    await cur.execute(Q_BLOB, (word,))
+                                    brow = await cur.fetchone()
+                                    blob = brow[0] if brow else None
+                                except Exception as e:
+                                    print("⚠️ words_blob lookup failed:", e)
+                                if blob:
+                                    l1_set(f"{word}:gz", blob)
+                                    await cache_set(f"{word}:gz", blob)
+                                    CACHE_HITS.labels(tier="blob").inc()
+                                    return gzip_response(blob, request)
+                            await cur.execute(query, params)
+                            raw_rows = await cur.fetchall()
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Query error: {e}")
+
+            with DECODE_TIME.time():
+                try:
+                    rows = [
+                        {"frame_number": frame_number, "keypoints": decode_keypoints(kp_raw)}
+                        for frame_number, kp_raw in raw_rows
+                    ]
+                except Exception as e:
+                    raise HTTPException(status_code=500, detail=f"Decode error: {e}")
+                # Load-bearing for legacy JSON rows (full-precision floats)
+                # and for coarser-than-default requests; migrated rows are
+                # already exact at 3 decimals, so for them the default round
+                # changes nothing.
+                if isinstance(round_decimals, int) and round_decimals >= 0:
+                    round_keypoints(rows, round_decimals)
+                payload = _dumps(rows)
+
+            if cacheable:
+                # Keypoint arrays are long lists of floats and compress 5-10x;
+                # level 1 is nearly free CPU-wise and the blob is compressed
+                # only once here instead of on every hit.
+                blob = gzip.compress(payload, compresslevel=1)
+                l1_set(f"{word}:gz", blob)
+                await cache_set(f"{word}:gz", blob)
+                return gzip_response(blob, request)
+
+            return Response(content=payload, media_type="application/json")
+        finally:
+            # Release on every exit — success, words_blob hit, or query error —
+            # so followers never sit out the full lock TTL.
+            if lock_held:
+                await release_regen_lock(word)
+
+
+BATCH_MAX_WORDS = int(os.getenv("BATCH_MAX_WORDS", 50))
+
+
+@app.get("/api/keypoints")
+async def get_keypoints_batch(
+    request: Request,
+    words: str = Query(..., description="Comma-separated words, e.g. words=hello,thank_you"),
+):
+    """
+    Batch lookup: all frames for several words (a phrase) in one request,
+    with default rounding. One MGET against Redis and at most one IN query
+    per backing table instead of K round-trips. Returns {word: frames}.
+    """
+    word_list = [w for w in dict.fromkeys(w.strip() for w in words.split(",")) if w]
+    if not word_list:
+        raise HTTPException(status_code=400, detail="No words given")
+    for w in word_list:
+        if not _WORD_RE.fullmatch(w):
+            raise HTTPException(status_code=400, detail=f"Invalid word: {w!r}")
+    if len(word_list) > BATCH_MAX_WORDS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_WORDS} words per request")
+
+    blobs: Dict[str, bytes] = {}
+    missing = []
+    for w in word_list:
+        cached = l1_get(f"{w}:gz")
+        if cached is not None:
+            blobs[w] = cached
         else:
-            return Response(content=json.dumps(rows, ensure_ascii=False), media_type="application/json")
-    except Exception as e:
-        print("⚠️ Response serialization failed, falling back to default response:", e)
-        return rows
+            missing.append(w)
+
+    if missing and REDIS_CLIENT is not None:
+        try:
+            vals = await REDIS_CLIENT.mget([f"{w}:gz" for w in missing])
+        except Exception as e:
+            print("⚠️ Redis MGET failed:", e)
+            vals = [None] * len(missing)
+        still_missing = []
+        for w, v in zip(missing, vals):
+            if v is not None:
+                blobs[w] = v
+                l1_set(f"{w}:gz", v)
+            else:
+                still_missing.append(w)
+        missing = still_missing
+
+    if missing and KNOWN_WORDS_READY and REDIS_CLIENT is not None:
+        # Unknown words render as [] without touching the DB.
+        try:
+            flags = await REDIS_CLIENT.smismember("known_words", missing)
+            missing = [w for w, known in zip(missing, flags) if known]
+        except Exception as e:
+            print("⚠️ known_words check failed:", e)
+
+    if missing:
+        if POOL is None:
+            raise HTTPException(status_code=500, detail="Database pool unavailable")
+        placeholders = ",".join(["%s"] * len(missing))
+        try:
+            async with POOL.acquire() as conn:
+                async with conn.cursor() as cur:
+                    try:
+                        await cur.execute(
+                            f"SELECT word, payload FROM words_blob WHERE word IN ({placeholders})",
+                            missing,
+                        )
+                        for w, payload in await cur.fetchall():
+                            if payload:
+                                blobs[w] = payload
+                    except Exception as e:
+                        print("⚠️ words_blob lookup failed:", e)
+                    uncached = [w for w in missing if w not in blobs]
+                    if uncached:
+                        ph = ",".join(["%s"] * len(uncached))
+                        await cur.execute(
+                            "SELECT word, frame_number, keypoints FROM words "
+                            f"WHERE word IN ({ph}) ORDER BY word, frame_number",
+                            uncached,
+                        )
+                        raw_rows = await cur.fetchall()
+                        for w, group in groupby(raw_rows, key=lambda r: r[0]):
+                            rows = [
+                                {"frame_number": fn, "keypoints": decode_keypoints(kp)}
+                                for _w, fn, kp in group
+                            ]
+                            # Same default rounding as the single-word path:
+                            # these blobs land under the same {word}:gz keys it
+                            # serves from, so the bytes must match.
+                            round_keypoints(rows, 3)
+                            blobs[w] = gzip.compress(_dumps(rows), compresslevel=1)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Query error: {e}")
+
+        new_blobs = {w: blobs[w] for w in missing if w in blobs}
+        for w, b in new_blobs.items():
+            l1_set(f"{w}:gz", b)
+        if new_blobs and REDIS_CLIENT is not None:
+            try:
+                async with REDIS_CLIENT.pipeline(transaction=False) as pipe:
+                    for w, b in new_blobs.items():
+                        pipe.set(f"{w}:gz", b, ex=CACHE_TTL)
+                    await pipe.execute()
+            except Exception as e:
+                print("⚠️ Redis pipeline SET failed:", e)
+
+    # Splice the per-word JSON arrays into one object without reparsing them.
+    parts = []
+    for w in word_list:
+        body = gzip.decompress(blobs[w]) if w in blobs else b"[]"
+        parts.append(_dumps(w) + b":" + body)
+    payload = b"{" + b",".join(parts) + b"}"
+    # Batch responses are the largest this API serves; recompress the spliced
+    # object at level 1 for clients that accept gzip, mirroring gzip_response.
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=gzip.compress(payload, compresslevel=1),
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers={"Vary": "Accept-Encoding"},
+    )
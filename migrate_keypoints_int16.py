@@ -0,0 +1,79 @@
+"""
+One-off migration: re-encode words.keypoints from JSON text to packed int16.
+
+Each coordinate is stored as round(value * 1000) clamped to int16 range,
+little-endian, three values per landmark, behind a one-byte NUL marker that
+identifies the format out-of-band (packed data can legitimately start with
+"[" or "{", legacy JSON text can never start with NUL) — a 33-landmark
+frame drops from ~1 KB of JSON floats to 199 bytes, and the API
+reconstructs it with a single np.frombuffer (see decode_keypoints in
+api.py).
+
+Safe to re-run: rows already carrying the marker are skipped. Run while the
+API is stopped or be prepared for mixed formats, which decode_keypoints
+handles.
+
+Usage: python migrate_keypoints_int16.py
+"""
+
+import asyncio
+import json
+
+import aiomysql
+import numpy as np
+
+from api import DB_CONF, KP_INT16_MAGIC
+
+BATCH_SIZE = 500
+
+
+def encode_keypoints(text) -> bytes:
+    arr = np.asarray(json.loads(text), dtype=np.float64)
+    packed = np.clip(np.round(arr * 1000), -32768, 32767).astype("<i2").tobytes()
+    return KP_INT16_MAGIC + packed
+
+
+async def main():
+    conn = await aiomysql.connect(**DB_CONF)
+    writer = await aiomysql.connect(**DB_CONF)
+    try:
+        async with conn.cursor() as cur:
+            await cur.execute("ALTER TABLE words MODIFY keypoints MEDIUMBLOB")
+
+        migrated = skipped = 0
+        async with conn.cursor(aiomysql.SSCursor) as cur:
+            await cur.execute("SELECT word, frame_number, keypoints FROM words")
+            while True:
+                batch = await cur.fetchmany(BATCH_SIZE)
+                if not batch:
+                    break
+                updates = []
+                for word, frame_number, raw in batch:
+                    if raw is None:
+                        # Nullable column; the API returns None for these rows,
+                        # nothing to re-encode.
+                        skipped += 1
+                        continue
+                    if isinstance(raw, (bytes, bytearray)):
+                        if raw[:1] == KP_INT16_MAGIC:
+                            skipped += 1
+                            continue
+                        raw = raw.decode("utf-8")
+                    updates.append((encode_keypoints(raw), word, frame_number))
+                if updates:
+                    async with writer.cursor() as wcur:
+                        await wcur.executemany(
+                            "UPDATE words SET keypoints = %s WHERE word = %s AND frame_number = %s",
+                            updates,
+                        )
+                    await writer.commit()
+                    migrated += len(updates)
+                print(f"migrated={migrated} skipped={skipped}", end="\r")
+        print(f"\n✅ Done: migrated={migrated} skipped={skipped}")
+    finally:
+        conn.close()
+        writer.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,61 @@
+"""
+Precompute per-word response blobs into the words_blob table.
+
+The hottest request shape — all frames for one word with default rounding —
+is a key/value lookup disguised as an ordered range scan. This script builds
+the finished gzip+JSON response for every word once, at ingest time, so the
+API can serve it with a single primary-key lookup (see the words_blob branch
+in api.py). Run it after loading new words; REPLACE INTO makes it idempotent.
+
+Usage: python precompute_word_blobs.py
+"""
+
+import asyncio
+import gzip
+
+import aiomysql
+
+from api import DB_CONF, decode_keypoints, round_keypoints, _dumps
+
+# Offline CPU is free, so compress harder than the API's level-1 fallback.
+COMPRESS_LEVEL = 6
+
+
+async def main():
+    conn = await aiomysql.connect(**DB_CONF)
+    try:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                "CREATE TABLE IF NOT EXISTS words_blob ("
+                "word VARCHAR(64) PRIMARY KEY, payload MEDIUMBLOB NOT NULL)"
+            )
+            await cur.execute("SELECT DISTINCT word FROM words")
+            words = [r[0] for r in await cur.fetchall()]
+
+            for i, word in enumerate(words, 1):
+                await cur.execute(
+                    "SELECT frame_number, keypoints FROM words "
+                    "WHERE word = %s ORDER BY frame_number",
+                    (word,),
+                )
+                rows = [
+                    {"frame_number": fn, "keypoints": decode_keypoints(kp)}
+                    for fn, kp in await cur.fetchall()
+                ]
+                # Match the API's default 3-decimal response byte-for-byte;
+                # legacy JSON rows carry full-precision floats until rounded.
+                round_keypoints(rows, 3)
+                blob = gzip.compress(_dumps(rows), compresslevel=COMPRESS_LEVEL)
+                await cur.execute(
+                    "REPLACE INTO words_blob (word, payload) VALUES (%s, %s)",
+                    (word, blob),
+                )
+                print(f"{i}/{len(words)} {word}", end="\r")
+        await conn.commit()
+        print(f"\n✅ Done: {len(words)} words.")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
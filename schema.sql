@@ -0,0 +1,26 @@
+-- Schema for the keypoints API.
+--
+-- The hot query is `WHERE word = ? ORDER BY frame_number`; without an index
+-- on (word, frame_number) MySQL filesorts the whole per-word rowset on every
+-- miss. With it, the planner does one seek plus a sequential range read in
+-- index order and the ORDER BY costs nothing. On a fresh table the clustered
+-- primary key provides exactly that ordering, so rows are stored in scan
+-- order and no secondary index is needed. InnoDB has no INCLUDE clause and
+-- carrying the MEDIUMBLOB keypoints column in a secondary index would
+-- roughly double storage, so for existing tables index the sort columns only.
+
+CREATE TABLE IF NOT EXISTS words (
+    word VARCHAR(64) NOT NULL,
+    frame_number INT NOT NULL,
+    keypoints MEDIUMBLOB,  -- packed int16, see migrate_keypoints_int16.py
+    PRIMARY KEY (word, frame_number)
+);
+
+-- For existing deployments whose words table has a different primary key:
+-- CREATE INDEX ix_words_word_frame ON words (word, frame_number);
+
+-- Precomputed gzip+JSON responses, see precompute_word_blobs.py.
+CREATE TABLE IF NOT EXISTS words_blob (
+    word VARCHAR(64) PRIMARY KEY,
+    payload MEDIUMBLOB NOT NULL
+);